@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Import probes run in a fresh interpreter by the test scripts.
+
+Usage (from the project root):
+    python -m scripts._probe_imports <probe>
+
+Keeping the probes in a module instead of inline ``python -c`` strings lets
+CPython reuse the cached bytecode in __pycache__ and avoids shell-quoting
+multi-line try/except blocks.
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _use_src():
+    """Make the in-tree package importable, as PYTHONPATH=src would."""
+    src_dir = os.path.join(PROJECT_ROOT, "src")
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+
+def package():
+    """Import the fast_fhir package."""
+    _use_src()
+    import fast_fhir
+    print("Package imported successfully")
+
+def c_extensions():
+    """Import the C parser extension, reporting (not failing) when it is missing."""
+    _use_src()
+    try:
+        import fast_fhir.fhir_parser_c
+        print("C extensions loaded successfully")
+    except ImportError as e:
+        print(f"C extensions not available: {e}")
+
+def metadata():
+    """Extract the package name from setup.py."""
+    import setuptools
+    setup_py = os.path.join(PROJECT_ROOT, "setup.py")
+    sys.argv = ["setup.py", "--name"]
+    with open(setup_py) as f:
+        exec(compile(f.read(), setup_py, "exec"), {"__name__": "__main__", "__file__": setup_py})
+
+PROBES = {
+    "package": package,
+    "c_extensions": c_extensions,
+    "metadata": metadata,
+}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1 or argv[0] not in PROBES:
+        print(f"Usage: python -m scripts._probe_imports {{{','.join(PROBES)}}}")
+        return 2
+    PROBES[argv[0]]()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Content-hash cache for the setup.py probes run by the configuration test scripts.
+
+`setup.py --help-commands` and `setup.py --name` only validate configuration, so
+their output is a function of setup.py, pyproject.toml, the interpreter and
+the setuptools/pkgconfig versions setup.py imports. A successful result is stored in ~/.cache/fast-fhir/configtest.json and reused
+until one of those changes; failures are never cached.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "fast-fhir", "configtest.json")
+CONFIG_FILES = ["setup.py", "pyproject.toml"]
+
+def _build_tool_versions():
+    """setuptools and pkgconfig versions; both change what the probes print."""
+    import setuptools
+    try:
+        pkgconfig_version = importlib.metadata.version("pkgconfig")
+    except importlib.metadata.PackageNotFoundError:
+        pkgconfig_version = None
+    return [setuptools.__version__, pkgconfig_version]
+
+def cache_key(args):
+    """Hash the probe command, the interpreter and build tool versions and the config file contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(list(args)).encode())
+    digest.update(sys.version.encode())
+    digest.update(json.dumps(_build_tool_versions()).encode())
+    for name in CONFIG_FILES:
+        try:
+            with open(os.path.join(PROJECT_ROOT, name), "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"missing:" + name.encode())
+    return digest.hexdigest()
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+def run_setup_probe(args, timeout=30):
+    """subprocess.run(args) with successful results cached by cache_key()."""
+    key = cache_key(args)
+    cache = _load_cache()
+    if key in cache:
+        entry = cache[key]
+        print(f"Using cached result for: {' '.join(args[1:])}")
+        return subprocess.CompletedProcess(args, entry["returncode"], entry["stdout"], entry["stderr"])
+
+    result = subprocess.run(args, capture_output=True, text=True, timeout=timeout, cwd=PROJECT_ROOT)
+    if result.returncode == 0:
+        # Re-read so concurrent probes do not drop each other's entries.
+        cache = _load_cache()
+        cache[key] = {"returncode": result.returncode, "stdout": result.stdout, "stderr": result.stderr}
+        _save_cache(cache)
+    return result
@@ -1,18 +1,17 @@
 #!/usr/bin/env python3
 """Test the pyproject.toml configuration."""
 
-import subprocess
 import sys
 
+from _setup_probe_cache import run_setup_probe
+
 def test_config():
     """Test if the configuration is valid."""
     print("Testing pyproject.toml configuration...")
     
     try:
-        # Test if setup.py can be parsed without errors
-        result = subprocess.run([
-            sys.executable, "setup.py", "--help-commands"
-        ], capture_output=True, text=True, timeout=30)
+        # Test if setup.py can be parsed without errors (cached per setup.py/pyproject.toml)
+        result = run_setup_probe([sys.executable, "setup.py", "--help-commands"])
         
         if result.returncode == 0:
             print("SUCCESS: setup.py configuration is valid")
@@ -3,12 +3,24 @@
 Test script to verify license configuration works with Python 3.12+
 """
 
-import subprocess
 import sys
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-def test_license_config():
+from _setup_probe_cache import run_setup_probe
+
+def run_probe(args):
+    """Run a cached setup.py probe, returning the CompletedProcess or the exception raised."""
+    try:
+        return run_setup_probe(args)
+    except Exception as e:
+        return e
+
+HELP_COMMANDS_PROBE = [sys.executable, "setup.py", "--help-commands"]
+METADATA_PROBE = [sys.executable, "-m", "scripts._probe_imports", "metadata"]
+
+def test_license_config(result=None):
     """Test if the license configuration works without errors."""
     print("Testing License Configuration Compatibility")
     print("=" * 45)
@@ -18,9 +30,10 @@ def test_license_config():
     # Test setup.py parsing
     print("\n🔄 Testing setup.py configuration...")
     try:
-        result = subprocess.run([
-            sys.executable, "setup.py", "--help-commands"
-        ], capture_output=True, text=True, timeout=30)
+        if result is None:
+            result = run_probe(HELP_COMMANDS_PROBE)
+        if isinstance(result, Exception):
+            raise result
         
         if result.returncode == 0:
             print("SUCCESS: setup.py configuration valid")
@@ -42,18 +55,16 @@ def test_license_config():
         print(f"ERROR: Error testing setup.py: {e}")
         return False
 
-def test_build_metadata():
+def test_build_metadata(result=None):
     """Test if we can extract build metadata without errors."""
     print("\n🔄 Testing build metadata extraction...")
     
     try:
         # Try to get package metadata
-        result = subprocess.run([
-            sys.executable, "-c", 
-            "import setuptools; from setuptools import setup; "
-            "import sys; sys.argv = ['setup.py', '--name']; "
-            "exec(open('setup.py').read())"
-        ], capture_output=True, text=True, timeout=30)
+        if result is None:
+            result = run_probe(METADATA_PROBE)
+        if isinstance(result, Exception):
+            raise result
         
         if result.returncode == 0:
             print("SUCCESS: Build metadata extraction successful")
@@ -73,9 +84,13 @@ def main():
         print("ERROR: setup.py not found. Run this from the project root.")
         sys.exit(1)
     
+    # Both probes only read setup.py, so run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        help_commands, metadata = pool.map(run_probe, [HELP_COMMANDS_PROBE, METADATA_PROBE])
+    
     success = True
-    success &= test_license_config()
-    success &= test_build_metadata()
+    success &= test_license_config(help_commands)
+    success &= test_build_metadata(metadata)
     
     print("\nLicense Configuration Test Summary:")
     if success:
@@ -1,37 +1,137 @@
 """Setup script for Fast-FHIR with high-performance C extensions."""
 
 from setuptools import setup, Extension, find_packages
-import platform
-
-# Get cJSON library flags
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import OptionError
 try:
+    from setuptools.modified import newer_group
+except ImportError:  # setuptools < 69
+    from distutils.dep_util import newer_group
+import glob
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+# pkg-config results are cached so repeated setup.py invocations (pip, build_ext,
+# --help-commands in the CI scripts) do not fork pkg-config every time.
+PKGCONFIG_CACHE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'fast-fhir', 'pkgconfig.json')
+PKGCONFIG_DIRS = [
+    '/usr/lib/pkgconfig', '/usr/lib64/pkgconfig', '/usr/share/pkgconfig',
+    '/usr/local/lib/pkgconfig', '/usr/local/share/pkgconfig',
+    '/opt/homebrew/lib/pkgconfig',
+] + glob.glob('/usr/lib/*/pkgconfig')
+
+
+def find_pc_file(package):
+    """Locate package.pc on the pkg-config search path without running pkg-config."""
+    search_path = []
+    for var in ('PKG_CONFIG_PATH', 'PKG_CONFIG_LIBDIR'):
+        search_path.extend(p for p in os.environ.get(var, '').split(os.pathsep) if p)
+    for directory in search_path + PKGCONFIG_DIRS:
+        pc_file = os.path.join(directory, f'{package}.pc')
+        if os.path.isfile(pc_file):
+            return pc_file
+    return None
+
+
+def cached_pkgconfig_parse(package):
+    """pkgconfig.parse() with an on-disk cache keyed by pkg-config binary and .pc mtime."""
     import pkgconfig
-    cjson_flags = pkgconfig.parse('libcjson')
-    include_dirs = cjson_flags['include_dirs']
-    library_dirs = cjson_flags['library_dirs']
-    libraries = cjson_flags['libraries']
-    print("Found cJSON via pkg-config")
-except (ImportError, Exception) as e:
-    # Fallback if pkg-config not available or cJSON not found
-    print(f"pkg-config not available or cJSON not found: {e}")
-    print("Using fallback paths for cJSON")
-    
-    if platform.system() == 'Darwin':  # macOS
+
+    pc_file = find_pc_file(package)
+    if pc_file is None:
+        return pkgconfig.parse(package)
+
+    key = f"{shutil.which('pkg-config')}|{pc_file}|{os.stat(pc_file).st_mtime}|{package}"
+    try:
+        with open(PKGCONFIG_CACHE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if key in cache:
+        return cache[key]
+
+    flags = pkgconfig.parse(package)
+    cache[key] = flags
+    try:
+        os.makedirs(os.path.dirname(PKGCONFIG_CACHE), exist_ok=True)
+        with open(PKGCONFIG_CACHE, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+    return flags
+
+
+# Commands that compile extensions. Metadata-only invocations (--name,
+# --help-commands, egg_info, dist_info) skip cJSON detection and use the
+# fallback paths, so they need neither pkg-config nor the pkgconfig module.
+BUILD_COMMANDS = {'build', 'build_ext', 'bdist_wheel', 'bdist_egg', 'editable_wheel', 'install', 'develop'}
+
+# pkg-config names cJSON is packaged under, in order of preference.
+CJSON_PKGCONFIG_NAMES = ['libcjson', 'cjson', 'libcjson1']
+
+
+def fallback_cjson_flags():
+    """Return (include_dirs, library_dirs, libraries) from well-known cJSON locations."""
+    if sys.platform == 'darwin':  # macOS
         # Try both Intel and Apple Silicon paths
         include_dirs = ['/usr/local/include', '/opt/homebrew/include']
         library_dirs = ['/usr/local/lib', '/opt/homebrew/lib']
-    elif platform.system() == 'Windows':
+    elif sys.platform == 'win32':
         # Windows fallback - C extensions will be disabled
         include_dirs = []
         library_dirs = []
     else:
         include_dirs = ['/usr/local/include']
         library_dirs = ['/usr/local/lib']
-    libraries = ['cjson']
+    return include_dirs, library_dirs, ['cjson']
+
+
+def resolve_cjson_flags():
+    """Return (include_dirs, library_dirs, libraries) for cJSON, preferring pkg-config.
+
+    Distributions ship the .pc file under different names, so each of
+    CJSON_PKGCONFIG_NAMES is checked with a cheap existence probe and the first
+    match is parsed. The hard-coded fallback paths are only used when pkg-config
+    (or the pkgconfig module) is missing or none of the names is known.
+    """
+    try:
+        import pkgconfig
+    except ImportError:
+        print("pkgconfig module not available - using fallback paths for cJSON")
+        return fallback_cjson_flags()
+
+    for name in CJSON_PKGCONFIG_NAMES:
+        try:
+            if find_pc_file(name) is None and not pkgconfig.exists(name):
+                continue
+            cjson_flags = cached_pkgconfig_parse(name)
+        except EnvironmentError as e:
+            print(f"pkg-config not available: {e}")
+            print("Using fallback paths for cJSON")
+            return fallback_cjson_flags()
+        print(f"Found cJSON via pkg-config ({name})")
+        return cjson_flags['include_dirs'], cjson_flags['library_dirs'], cjson_flags['libraries']
+
+    print(f"cJSON not found via pkg-config (tried {', '.join(CJSON_PKGCONFIG_NAMES)})")
+    print("Using fallback paths for cJSON")
+    return fallback_cjson_flags()
+
+
+# Get cJSON library flags
+if BUILD_COMMANDS.intersection(sys.argv[1:]):
+    include_dirs, library_dirs, libraries = resolve_cjson_flags()
+else:
+    include_dirs, library_dirs, libraries = fallback_cjson_flags()
 
 # Additional compile args for better compatibility
 extra_compile_args = ['-O3', '-std=c99']
-if platform.system() == 'Darwin':
+if sys.platform == 'darwin':
     # Fix macOS universal build issues
     extra_compile_args.extend(['-Wno-error=unused-command-line-argument-hard-error-in-future'])
     # Don't force architecture - let Python decide
@@ -41,6 +141,243 @@ if platform.system() == 'Darwin':
     elif 'x86_64' in sysconfig.get_platform():
         extra_compile_args.extend(['-arch', 'x86_64'])
 
+# Shared FHIR headers worth precompiling. fhir_foundation.h pulls in
+# fhir_datatypes.h, Python.h and cJSON.h, which dominate per-TU parse time.
+EXT_DIR = 'src/fast_fhir/ext'
+PCH_HEADERS = ['fhir_foundation.h']
+# Headers every extension may include, declared as Extension.depends so an edit
+# to any of them makes the built .so files stale.
+EXT_HEADERS = glob.glob(os.path.join(EXT_DIR, '**', '*.h'), recursive=True)
+LOCAL_INCLUDE = re.compile(r'^\s*#\s*include\s+"([^"]+)"', re.MULTILINE)
+
+
+def local_includes(path, seen=None):
+    """Return the EXT_DIR headers path includes with #include "...", transitively."""
+    seen = set() if seen is None else seen
+    with open(path, encoding='utf-8', errors='replace') as f:
+        names = LOCAL_INCLUDE.findall(f.read())
+    for name in names:
+        header = os.path.join(EXT_DIR, name)
+        if name not in seen and os.path.exists(header):
+            seen.add(name)
+            local_includes(header, seen)
+    return seen
+
+
+def uses_pch_headers(source):
+    """Return True if source already includes every header in PCH_HEADERS.
+
+    Only such files get the precompiled header force-included; for any other
+    file it would change what the file sees, e.g. macros it defines itself.
+    """
+    return set(PCH_HEADERS) <= local_includes(source)
+
+
+# Link-time optimisation lets the linker inline across fhir_datatypes.c,
+# fhir_foundation.c and the Python glue, and section GC drops unused helpers.
+# Each entry is (compile args, link args); the first one the compiler accepts wins.
+if sys.platform == 'darwin':
+    GC_SECTIONS_LINK_ARGS = ['-Wl,-dead_strip']
+else:
+    GC_SECTIONS_LINK_ARGS = ['-Wl,--gc-sections']
+UNIX_LTO_CANDIDATES = [
+    (['-flto=auto', '-ffunction-sections', '-fdata-sections'], ['-flto=auto'] + GC_SECTIONS_LINK_ARGS),
+    (['-flto', '-ffunction-sections', '-fdata-sections'], ['-flto'] + GC_SECTIONS_LINK_ARGS),
+]
+MSVC_LTO_CANDIDATES = [
+    (['/GL'], ['/LTCG']),
+]
+
+# GCC/Clang code generation flags: -pipe avoids temp files between compiler
+# stages, -fno-semantic-interposition allows inlining across functions in the
+# same .so and -fvisibility=hidden keeps helpers out of the dynamic symbol
+# table (module init functions are marked FHIR_MODINIT_FUNC to stay exported).
+UNIX_CODEGEN_FLAGS = ['-pipe', '-fno-semantic-interposition', '-fvisibility=hidden']
+
+
+def makeflags_jobs():
+    """Return N from -jN/--jobs=N in MAKEFLAGS (e.g. under 'make -j2'), else None."""
+    match = re.search(r'(?:^|\s)(?:-j\s*|--jobs=)(\d+)', os.environ.get('MAKEFLAGS', ''))
+    return int(match.group(1)) if match else None
+
+
+def available_cpus():
+    """Return the CPUs this process may run on, respecting affinity/cgroup limits."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    process_cpu_count = getattr(os, 'process_cpu_count', os.cpu_count)  # Python 3.13+
+    return process_cpu_count() or 1
+
+
+class FastFHIRBuildExt(build_ext):
+    """build_ext that precompiles the shared FHIR headers once per build."""
+
+    user_options = build_ext.user_options + [
+        ('pgo=', None, "profile-guided optimisation stage: 'generate' or 'use'"),
+        ('pgo-dir=', None, "directory for PGO profile data [default: pgo]"),
+    ]
+
+    def initialize_options(self):
+        super().initialize_options()
+        self.pgo = None
+        self.pgo_dir = None
+
+    def finalize_options(self):
+        super().finalize_options()
+        if self.pgo not in (None, 'generate', 'use'):
+            raise OptionError("--pgo must be 'generate' or 'use'")
+        if self.pgo_dir is None:
+            self.pgo_dir = 'pgo'
+        if self.pgo:
+            # Objects from the other PGO stage look up to date but are not.
+            self.force = True
+        if self.parallel is None and self.extensions:
+            # Default to parallel builds; an explicit -j/--parallel always wins.
+            jobs = makeflags_jobs() or available_cpus()
+            self.parallel = max(1, min(jobs, len(self.extensions)))
+
+    def build_extensions(self):
+        if not any(self._is_stale(ext) for ext in self.extensions):
+            # Nothing to compile or link, so skip the compiler probes and PCH too.
+            print("C extensions are up to date")
+            return
+
+        compile_args, link_args = self._select_lto_flags()
+        codegen_args = self._select_codegen_flags()
+        pgo_compile_args, pgo_link_args = self._select_pgo_flags()
+        compile_args = compile_args + pgo_compile_args
+        link_args = link_args + pgo_link_args
+        for ext in self.extensions:
+            # The codegen flags (-fvisibility=hidden) are tuned for the
+            # hand-written modules in EXT_DIR, not for Cython-generated C.
+            extra = codegen_args + compile_args if is_fhir_c_extension(ext) else compile_args
+            ext.extra_compile_args = list(ext.extra_compile_args or []) + extra
+            ext.extra_link_args = list(ext.extra_link_args or []) + link_args
+
+        pch_extensions = [ext for ext in self.extensions
+                          if any(uses_pch_headers(source) for source in ext.sources)]
+        pch_args = self._build_precompiled_header(pch_extensions)
+        if pch_args:
+            self._force_include(pch_args, {source for ext in pch_extensions
+                                           for source in ext.sources if uses_pch_headers(source)})
+        super().build_extensions()
+
+    def _is_stale(self, ext):
+        """Return True if build_ext would rebuild ext (the same test it uses itself)."""
+        depends = list(ext.sources) + list(ext.depends or [])
+        return self.force or newer_group(depends, self.get_ext_fullpath(ext.name), 'newer')
+
+    def _compiler_accepts(self, compile_args, link_args):
+        """Return True if a trivial shared object builds with the given flags."""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, 'probe.c')
+            with open(source, 'w') as f:
+                f.write('int fast_fhir_probe(void) { return 0; }\n')
+            try:
+                objects = self.compiler.compile([source], output_dir=tmp,
+                                                extra_postargs=compile_args)
+                self.compiler.link_shared_object(objects, os.path.join(tmp, 'probe.so'),
+                                                 extra_postargs=link_args)
+            except Exception:
+                return False
+        return True
+
+    def _select_lto_flags(self):
+        """Pick LTO/section-GC flags supported by the active compiler."""
+        if self.compiler.compiler_type == 'unix':
+            candidates = UNIX_LTO_CANDIDATES
+        elif self.compiler.compiler_type == 'msvc':
+            candidates = MSVC_LTO_CANDIDATES
+        else:
+            return [], []
+
+        for compile_args, link_args in candidates:
+            if self._compiler_accepts(compile_args, link_args):
+                print(f"Using link-time optimisation: {' '.join(compile_args + link_args)}")
+                return compile_args, link_args
+
+        print("Link-time optimisation not supported by this compiler")
+        return [], []
+
+    def _select_codegen_flags(self):
+        """Return the UNIX_CODEGEN_FLAGS the active compiler accepts."""
+        if self.compiler.compiler_type != 'unix':
+            return []
+        if self._compiler_accepts(UNIX_CODEGEN_FLAGS, []):
+            return list(UNIX_CODEGEN_FLAGS)
+        return [flag for flag in UNIX_CODEGEN_FLAGS if self._compiler_accepts([flag], [])]
+
+    def _select_pgo_flags(self):
+        """Return profile-guided optimisation flags for the requested --pgo stage."""
+        if not self.pgo:
+            return [], []
+        if self.compiler.compiler_type != 'unix':
+            print("Profile-guided optimisation requires GCC/Clang - ignoring --pgo")
+            return [], []
+
+        profile_dir = os.path.abspath(self.pgo_dir)
+        if self.pgo == 'generate':
+            os.makedirs(profile_dir, exist_ok=True)
+            flags = [f'-fprofile-generate={profile_dir}']
+        else:
+            flags = [f'-fprofile-use={profile_dir}', '-fprofile-correction']
+
+        if not self._compiler_accepts(flags, flags):
+            print(f"Compiler rejected PGO flags {' '.join(flags)} - ignoring --pgo")
+            return [], []
+        print(f"Profile-guided optimisation ({self.pgo}): {' '.join(flags)}")
+        return flags, flags
+
+    def _force_include(self, pch_args, sources):
+        """Add pch_args to the compile command of each file in sources only.
+
+        Extensions mix files that include fhir_foundation.h with files that do
+        not (fhir_datatypes.c), so the flags cannot go in extra_compile_args.
+        """
+        compile_one = self.compiler._compile
+
+        def _compile(obj, src, ext, cc_args, extra_postargs, pp_opts):
+            if src in sources:
+                extra_postargs = list(extra_postargs) + pch_args
+            compile_one(obj, src, ext, cc_args, extra_postargs, pp_opts)
+
+        self.compiler._compile = _compile
+
+    def _build_precompiled_header(self, pch_extensions):
+        """Compile PCH_HEADERS into a .gch and return the flags that use it.
+
+        Only GCC/Clang ('unix' compilers) are supported; MSVC builds (/Yc, /Yu)
+        are not wired up because C extensions are disabled on Windows. Any
+        failure falls back to a normal build without the precompiled header.
+        """
+        if self.compiler.compiler_type != 'unix' or not pch_extensions:
+            return []
+
+        pch_dir = os.path.join(self.build_temp, 'pch')
+        os.makedirs(pch_dir, exist_ok=True)
+        pch_header = os.path.join(pch_dir, 'fast_fhir_pch.h')
+        with open(pch_header, 'w') as f:
+            for header in PCH_HEADERS:
+                f.write(f'#include "{header}"\n')
+
+        # The .gch is only accepted when compiled with the same flags as the
+        # translation units, so reuse the first such extension's configuration.
+        ext = pch_extensions[0]
+        include_dirs = [EXT_DIR] + list(ext.include_dirs or []) + list(self.include_dirs or [])
+        cmd = list(self.compiler.compiler_so)
+        cmd += ['-I' + d for d in include_dirs]
+        cmd += list(ext.extra_compile_args or [])
+        cmd += ['-x', 'c-header', pch_header, '-o', pch_header + '.gch']
+        try:
+            self.compiler.spawn(cmd)
+        except Exception as e:
+            print(f"Precompiled header disabled: {e}")
+            return []
+
+        print(f"Built precompiled header for {', '.join(PCH_HEADERS)}")
+        return ['-I' + EXT_DIR, '-include', pch_header]
+
+
 # Define the C extensions
 fhir_parser_c = Extension(
     'fast_fhir.fhir_parser_c',
@@ -48,7 +385,8 @@ fhir_parser_c = Extension(
     include_dirs=include_dirs,
     library_dirs=library_dirs,
     libraries=libraries,
-    extra_compile_args=extra_compile_args
+    extra_compile_args=extra_compile_args,
+    depends=EXT_HEADERS
 )
 
 fhir_datatypes_c = Extension(
@@ -60,7 +398,8 @@ fhir_datatypes_c = Extension(
     include_dirs=include_dirs,
     library_dirs=library_dirs,
     libraries=libraries,
-    extra_compile_args=extra_compile_args
+    extra_compile_args=extra_compile_args,
+    depends=EXT_HEADERS
 )
 
 fhir_foundation_c = Extension(
@@ -73,7 +412,8 @@ fhir_foundation_c = Extension(
     include_dirs=include_dirs,
     library_dirs=library_dirs,
     libraries=libraries,
-    extra_compile_args=extra_compile_args
+    extra_compile_args=extra_compile_args,
+    depends=EXT_HEADERS
 )
 
 fhir_clinical_c = Extension(
@@ -87,7 +427,8 @@ fhir_clinical_c = Extension(
     include_dirs=include_dirs,
     library_dirs=library_dirs,
     libraries=libraries,
-    extra_compile_args=extra_compile_args
+    extra_compile_args=extra_compile_args,
+    depends=EXT_HEADERS
 )
 
 fhir_medication_c = Extension(
@@ -101,7 +442,8 @@ fhir_medication_c = Extension(
     include_dirs=include_dirs,
     library_dirs=library_dirs,
     libraries=libraries,
-    extra_compile_args=extra_compile_args
+    extra_compile_args=extra_compile_args,
+    depends=EXT_HEADERS
 )
 
 fhir_workflow_c = Extension(
@@ -115,7 +457,8 @@ fhir_workflow_c = Extension(
     include_dirs=include_dirs,
     library_dirs=library_dirs,
     libraries=libraries,
-    extra_compile_args=extra_compile_args
+    extra_compile_args=extra_compile_args,
+    depends=EXT_HEADERS
 )
 
 fhir_specialized_c = Extension(
@@ -129,7 +472,8 @@ fhir_specialized_c = Extension(
     include_dirs=include_dirs,
     library_dirs=library_dirs,
     libraries=libraries,
-    extra_compile_args=extra_compile_args
+    extra_compile_args=extra_compile_args,
+    depends=EXT_HEADERS
 )
 
 fhir_new_resources_c = Extension(
@@ -143,14 +487,85 @@ fhir_new_resources_c = Extension(
     include_dirs=include_dirs,
     library_dirs=library_dirs,
     libraries=libraries,
-    extra_compile_args=extra_compile_args
+    extra_compile_args=extra_compile_args,
+    depends=EXT_HEADERS
 )
 
+C_EXTENSIONS = [
+    fhir_parser_c, fhir_datatypes_c, fhir_foundation_c, fhir_clinical_c,
+    fhir_medication_c, fhir_workflow_c, fhir_specialized_c, fhir_new_resources_c,
+]
+
+# Pure-Python modules compiled with Cython when it is installed. They remain
+# importable as plain Python, so Cython is never a requirement.
+CYTHON_MODULES = ['src/fast_fhir/resources/_validate.py']
+CYTHON_EXTENSIONS = [
+    Extension(os.path.splitext(os.path.relpath(path, 'src'))[0].replace(os.sep, '.'), [path])
+    for path in CYTHON_MODULES
+]
+
+def is_fhir_c_extension(ext):
+    """True for the hand-written C extensions built from EXT_DIR."""
+    return all(os.path.dirname(source) == EXT_DIR for source in ext.sources)
+
+def cython_extensions(extensions):
+    """Cythonize extensions, or return [] when Cython is not installed."""
+    if not extensions:
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize(extensions, compiler_directives={'language_level': '3'}, quiet=True)
+
+def extension_short_name(ext):
+    """'fast_fhir.fhir_clinical_c' -> 'clinical', 'fast_fhir.resources._validate' -> 'validate'."""
+    name = ext.name.rsplit('.', 1)[-1].lstrip('_')
+    if name.startswith('fhir_'):
+        name = name[len('fhir_'):]
+    if name.endswith('_c'):
+        name = name[:-len('_c')]
+    return name
+
+def extension_names(ext):
+    """Names FAST_FHIR_EXTENSIONS accepts for ext: full, module and short name."""
+    return {ext.name, ext.name.rsplit('.', 1)[-1], extension_short_name(ext)}
+
+def requested_extensions():
+    """Names listed in FAST_FHIR_EXTENSIONS, or None when it is unset.
+
+    Exits with an error for a name that matches no C or Cython extension, so a
+    typo fails the build instead of silently building nothing.
+    """
+    selected = os.environ.get('FAST_FHIR_EXTENSIONS')
+    if not selected:
+        return None
+    wanted = {name.strip() for name in selected.split(',') if name.strip()}
+    known = set().union(*(extension_names(ext) for ext in C_EXTENSIONS + CYTHON_EXTENSIONS))
+    unknown = wanted - known
+    if unknown:
+        choices = ', '.join(sorted(extension_short_name(ext) for ext in C_EXTENSIONS + CYTHON_EXTENSIONS))
+        sys.exit(f"FAST_FHIR_EXTENSIONS: unknown extension(s) {', '.join(sorted(unknown))}; "
+                 f"expected a full, module or short name of: {choices}")
+    print(f"Extensions restricted via FAST_FHIR_EXTENSIONS: {selected}")
+    return wanted
+
+def select_extensions(extensions, wanted):
+    """The extensions named in wanted, or all of them when wanted is None."""
+    if wanted is None:
+        return extensions
+    return [ext for ext in extensions if extension_names(ext) & wanted]
+
+# FAST_FHIR_EXTENSIONS=parser,foundation restricts the build to fhir_parser_c
+# and fhir_foundation_c while iterating on them; the filter covers the Cython
+# modules too, so FAST_FHIR_EXTENSIONS=validate builds only _validate.
+wanted_extensions = requested_extensions()
+
 # Determine if we should build C extensions
 build_c_extensions = True
 
 # Check if we have the necessary dependencies for C extensions
-if platform.system() == 'Windows':
+if sys.platform == 'win32':
     print("Windows detected - C extensions disabled by default")
     build_c_extensions = False
 elif not include_dirs or not library_dirs:
@@ -158,7 +573,6 @@ elif not include_dirs or not library_dirs:
     build_c_extensions = False
 
 # Allow disabling C extensions via environment variable
-import os
 if os.environ.get('FAST_FHIR_DISABLE_C_EXTENSIONS'):
     print("C extensions disabled via environment variable")
     build_c_extensions = False
@@ -167,7 +581,6 @@ if os.environ.get('FAST_FHIR_DISABLE_C_EXTENSIONS'):
 ext_modules = []
 if build_c_extensions:
     try:
-        import os
         available_extensions = []
         
         # Check which C files actually exist and can compile
@@ -184,7 +597,7 @@ if build_c_extensions:
         # if os.path.exists('src/fast_fhir/ext/fhir_new_resources.c'):
         #     available_extensions.append(fhir_new_resources_c)
         
-        ext_modules = available_extensions
+        ext_modules = select_extensions(available_extensions, wanted_extensions)
         print(f"Building with {len(ext_modules)} C extensions")
     except Exception as e:
         print(f"C extension setup failed: {e}")
@@ -193,10 +606,20 @@ if build_c_extensions:
 else:
     print("Installing in Python-only mode")
 
+# The Cython modules do not use cJSON, so they are built whenever Cython is
+# available unless compiled extensions are disabled outright or
+# FAST_FHIR_EXTENSIONS leaves them out.
+if BUILD_COMMANDS.intersection(sys.argv[1:]) and not os.environ.get('FAST_FHIR_DISABLE_C_EXTENSIONS'):
+    compiled_modules = cython_extensions(select_extensions(CYTHON_EXTENSIONS, wanted_extensions))
+    if compiled_modules:
+        print(f"Compiling {len(compiled_modules)} module(s) with Cython")
+        ext_modules = ext_modules + compiled_modules
+
 setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     ext_modules=ext_modules,
+    cmdclass={"build_ext": FastFHIRBuildExt},
     package_data={
         "fast_fhir": ["ext/*.c", "ext/*.h"],
     },
@@ -3,6 +3,8 @@
 __version__ = "0.1.0"
 __fhir_version__ = "5.0.0"
 
+import importlib
+
 # Import main functionality for easy access
 try:
     from .parser import FHIRParser
@@ -12,11 +14,15 @@ except ImportError:
     FHIRParser = None
     FastFHIRParser = None
 
-# Import deserializers
-try:
-    from .deserializers import *
-except ImportError:
-    pass
+
+def __getattr__(name):
+    # Deserializer names are resolved on first access instead of star-importing
+    # fast_fhir.deserializers, which would load every Pydantic model up front.
+    deserializers = importlib.import_module('.deserializers', __name__)
+    if name in deserializers._ALL_CORE or name in deserializers._LAZY_NAMES:
+        return getattr(deserializers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "__version__",
@@ -21,140 +21,119 @@ Usage:
     from fast_fhir.deserializers import deserialize_patient, deserialize_practitioner
 """
 
-# Import care provision deserializer functionality
-try:
-    from .deserializers import (
-        FHIRCareProvisionDeserializer,
-        FHIRDeserializationError,
-        deserialize_care_provision_resource,
-        deserialize_care_plan,
-        deserialize_care_team,
-        deserialize_goal,
-        deserialize_service_request,
-        deserialize_risk_assessment,
-        deserialize_vision_prescription,
-        deserialize_nutrition_order
-    )
-    CARE_PROVISION_DESERIALIZERS_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Care provision deserializers not available: {e}")
-    CARE_PROVISION_DESERIALIZERS_AVAILABLE = False
-
-# Import foundation deserializer functionality
-try:
-    from .foundation_deserializers import (
-        FHIRFoundationDeserializer,
-        FHIRFoundationDeserializationError,
-        deserialize_patient,
-        deserialize_practitioner,
-        deserialize_practitioner_role,
-        deserialize_encounter,
-        deserialize_person,
-        deserialize_related_person,
-        deserialize_group
-    )
-    FOUNDATION_DESERIALIZERS_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Foundation deserializers not available: {e}")
-    FOUNDATION_DESERIALIZERS_AVAILABLE = False
-
-# Import entities deserializer functionality
-try:
-    from .entities_deserializers import (
-        FHIREntitiesDeserializer,
-        FHIREntitiesDeserializationError,
-        deserialize_organization,
-        deserialize_location,
-        deserialize_healthcare_service,
-        deserialize_endpoint,
-        deserialize_device,
-        deserialize_substance,
-        deserialize_organization_affiliation,
-        deserialize_biologically_derived_product,
-        deserialize_nutrition_product,
-        deserialize_device_metric
-    )
-    ENTITIES_DESERIALIZERS_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Entities deserializers not available: {e}")
-    ENTITIES_DESERIALIZERS_AVAILABLE = False
-
-# Import Pydantic models for care provision resources
-try:
-    from .pydantic_care_provision import (
-        CarePlan,
-        CareTeam,
-        Goal,
-        ServiceRequest,
-        RiskAssessment,
-        VisionPrescription,
-        NutritionOrder
-    )
-    PYDANTIC_CARE_PROVISION_AVAILABLE = True
-except ImportError:
-    PYDANTIC_CARE_PROVISION_AVAILABLE = False
-
-# Import Pydantic models for foundation resources
-try:
-    from .pydantic_foundation import (
-        PatientModel,
-        PractitionerModel,
-        PractitionerRoleModel,
-        EncounterModel,
-        PersonModel,
-        RelatedPersonModel,
-        GroupModel,
-        HumanName,
-        ContactPoint,
-        Address,
-        Identifier,
-        Reference,
-        CodeableConcept,
-        AdministrativeGender
-    )
-    PYDANTIC_FOUNDATION_AVAILABLE = True
-except ImportError:
-    PYDANTIC_FOUNDATION_AVAILABLE = False
-
-# Import Pydantic models for entities resources
-try:
-    from .pydantic_entities import (
-        OrganizationModel,
-        LocationModel,
-        HealthcareServiceModel,
-        EndpointModel,
-        DeviceModel,
-        SubstanceModel,
-        OrganizationAffiliationModel,
-        OrganizationContact,
-        LocationPosition,
-        DeviceUdiCarrier,
-        OrganizationType,
-        LocationStatus,
-        DeviceStatus
-    )
-    PYDANTIC_ENTITIES_AVAILABLE = True
-except ImportError:
-    PYDANTIC_ENTITIES_AVAILABLE = False
-
-# Import general Pydantic models
-try:
-    from .pydantic_models import (
-        FHIRResource,
-        FHIRElement,
-        FHIRExtension
-    )
-    PYDANTIC_GENERAL_AVAILABLE = True
-except ImportError:
-    PYDANTIC_GENERAL_AVAILABLE = False
-
-# Overall Pydantic availability
-PYDANTIC_AVAILABLE = (PYDANTIC_CARE_PROVISION_AVAILABLE or 
-                     PYDANTIC_FOUNDATION_AVAILABLE or 
-                     PYDANTIC_ENTITIES_AVAILABLE or
-                     PYDANTIC_GENERAL_AVAILABLE)
+import importlib
+
+# Pydantic model names per module; __all__ includes a tuple only when that
+# module imports successfully.
+_ALL_CARE = (
+    'CarePlan',
+    'CareTeam',
+    'Goal',
+    'ServiceRequest',
+    'RiskAssessment',
+    'VisionPrescription',
+    'NutritionOrder'
+)
+_ALL_FOUND = (
+    'PatientModel',
+    'PractitionerModel',
+    'PractitionerRoleModel',
+    'EncounterModel',
+    'PersonModel',
+    'RelatedPersonModel',
+    'GroupModel',
+    'HumanName',
+    'ContactPoint',
+    'Address',
+    'Identifier',
+    'Reference',
+    'CodeableConcept',
+    'AdministrativeGender'
+)
+_ALL_ENT = (
+    'OrganizationModel',
+    'LocationModel',
+    'HealthcareServiceModel',
+    'EndpointModel',
+    'DeviceModel',
+    'SubstanceModel',
+    'OrganizationAffiliationModel',
+    'OrganizationContact',
+    'LocationPosition',
+    'DeviceUdiCarrier',
+    'OrganizationType',
+    'LocationStatus',
+    'DeviceStatus'
+)
+_ALL_GEN = (
+    'FHIRResource',
+    'FHIRElement',
+    'FHIRExtension'
+)
+
+# Every public name is loaded lazily (PEP 562) so that importing fast_fhir does
+# not pay for building Pydantic model classes until one is actually used.
+# Each availability flag maps to (submodule, exported names, warning label);
+# a label of None means import failures are silent.
+_LAZY_GROUPS = {
+    'CARE_PROVISION_DESERIALIZERS_AVAILABLE': ('.deserializers', (
+        'FHIRCareProvisionDeserializer',
+        'FHIRDeserializationError',
+        'deserialize_care_provision_resource',
+        'deserialize_care_plan',
+        'deserialize_care_team',
+        'deserialize_goal',
+        'deserialize_service_request',
+        'deserialize_risk_assessment',
+        'deserialize_vision_prescription',
+        'deserialize_nutrition_order'
+    ), 'Care provision deserializers'),
+    'FOUNDATION_DESERIALIZERS_AVAILABLE': ('.foundation_deserializers', (
+        'FHIRFoundationDeserializer',
+        'FHIRFoundationDeserializationError',
+        'deserialize_patient',
+        'deserialize_practitioner',
+        'deserialize_practitioner_role',
+        'deserialize_encounter',
+        'deserialize_person',
+        'deserialize_related_person',
+        'deserialize_group'
+    ), 'Foundation deserializers'),
+    'ENTITIES_DESERIALIZERS_AVAILABLE': ('.entities_deserializers', (
+        'FHIREntitiesDeserializer',
+        'FHIREntitiesDeserializationError',
+        'deserialize_organization',
+        'deserialize_location',
+        'deserialize_healthcare_service',
+        'deserialize_endpoint',
+        'deserialize_device',
+        'deserialize_substance',
+        'deserialize_organization_affiliation',
+        'deserialize_biologically_derived_product',
+        'deserialize_nutrition_product',
+        'deserialize_device_metric'
+    ), 'Entities deserializers'),
+    'PYDANTIC_CARE_PROVISION_AVAILABLE': ('.pydantic_care_provision', _ALL_CARE, None),
+    'PYDANTIC_FOUNDATION_AVAILABLE': ('.pydantic_foundation', _ALL_FOUND, None),
+    'PYDANTIC_ENTITIES_AVAILABLE': ('.pydantic_entities', _ALL_ENT, None),
+    'PYDANTIC_GENERAL_AVAILABLE': ('.pydantic_models', _ALL_GEN, None),
+}
+
+# name -> availability flag of the group that provides it
+_LAZY_NAMES = {
+    name: flag
+    for flag, (_module, names, _label) in _LAZY_GROUPS.items()
+    for name in names
+}
+
+_PYDANTIC_FLAGS = (
+    'PYDANTIC_CARE_PROVISION_AVAILABLE',
+    'PYDANTIC_FOUNDATION_AVAILABLE',
+    'PYDANTIC_ENTITIES_AVAILABLE',
+    'PYDANTIC_GENERAL_AVAILABLE',
+)
 
-__all__ = [
+_ALL_CORE = (
     # Core deserializers
     'FHIRCareProvisionDeserializer',
     'FHIRFoundationDeserializer',
@@ -200,61 +179,61 @@ __all__ = [
     'PYDANTIC_FOUNDATION_AVAILABLE',
     'PYDANTIC_ENTITIES_AVAILABLE',
     'PYDANTIC_GENERAL_AVAILABLE'
-]
-
-# Add Care Provision Pydantic models to __all__ if available
-if PYDANTIC_CARE_PROVISION_AVAILABLE:
-    __all__.extend([
-        'CarePlan',
-        'CareTeam',
-        'Goal', 
-        'ServiceRequest',
-        'RiskAssessment',
-        'VisionPrescription',
-        'NutritionOrder'
-    ])
-
-# Add Foundation Pydantic models to __all__ if available
-if PYDANTIC_FOUNDATION_AVAILABLE:
-    __all__.extend([
-        'PatientModel',
-        'PractitionerModel',
-        'PractitionerRoleModel',
-        'EncounterModel',
-        'PersonModel',
-        'RelatedPersonModel',
-        'GroupModel',
-        'HumanName',
-        'ContactPoint',
-        'Address',
-        'Identifier',
-        'Reference',
-        'CodeableConcept',
-        'AdministrativeGender'
-    ])
+)
+
+
+def _load_group(flag):
+    """Import one group's submodule, publish its names and set its flag."""
+    module_name, names, label = _LAZY_GROUPS[flag]
+    try:
+        module = importlib.import_module(module_name, __name__)
+        values = {name: getattr(module, name) for name in names}
+    except (ImportError, AttributeError) as e:
+        if label:
+            print(f"Warning: {label} not available: {e}")
+        globals()[flag] = False
+        return False
+    globals().update(values)
+    globals()[flag] = True
+    return True
+
+
+def _is_available(flag):
+    """Return a group's availability flag, importing the group on first use."""
+    if flag in globals():
+        return globals()[flag]
+    return _load_group(flag)
+
+
+def _build_all():
+    """Compute __all__, listing Pydantic models only for groups that import."""
+    return list(
+        _ALL_CORE
+        + (_ALL_CARE if _is_available('PYDANTIC_CARE_PROVISION_AVAILABLE') else ())
+        + (_ALL_FOUND if _is_available('PYDANTIC_FOUNDATION_AVAILABLE') else ())
+        + (_ALL_ENT if _is_available('PYDANTIC_ENTITIES_AVAILABLE') else ())
+        + (_ALL_GEN if _is_available('PYDANTIC_GENERAL_AVAILABLE') else ())
+    )
 
-# Add Entities Pydantic models to __all__ if available
-if PYDANTIC_ENTITIES_AVAILABLE:
-    __all__.extend([
-        'OrganizationModel',
-        'LocationModel',
-        'HealthcareServiceModel',
-        'EndpointModel',
-        'DeviceModel',
-        'SubstanceModel',
-        'OrganizationAffiliationModel',
-        'OrganizationContact',
-        'LocationPosition',
-        'DeviceUdiCarrier',
-        'OrganizationType',
-        'LocationStatus',
-        'DeviceStatus'
-    ])
 
-# Add General Pydantic models to __all__ if available
-if PYDANTIC_GENERAL_AVAILABLE:
-    __all__.extend([
-        'FHIRResource',
-        'FHIRElement',
-        'FHIRExtension'
-    ])
\ No newline at end of file
+def __getattr__(name):
+    if name in _LAZY_GROUPS:
+        return _load_group(name)
+    if name in _LAZY_NAMES:
+        if _is_available(_LAZY_NAMES[name]):
+            return globals()[name]
+    elif name == 'PYDANTIC_AVAILABLE':
+        # Overall Pydantic availability
+        value = any([_is_available(flag) for flag in _PYDANTIC_FLAGS])
+        globals()[name] = value
+        return value
+    elif name == '__all__':
+        value = _build_all()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_LAZY_GROUPS)
+                  | {'PYDANTIC_AVAILABLE', '__all__'})
@@ -4,6 +4,8 @@ Converts JSON strings to FHIR entities resource objects (Organization, Location,
 """
 
 import json
+import keyword
+import warnings
 from typing import Union, Dict, Any, Optional, Type, TypeVar
 from datetime import datetime, date
 
@@ -214,12 +216,28 @@ class FHIREntitiesDeserializer:
         """Set resource attributes from data"""
         # Skip constructor fields
         skip_fields = {'resourceType', 'resource_type', 'id'}
+        unmodeled = {}
         
         for key, value in data.items():
             if key not in skip_fields:
                 # Convert camelCase to snake_case for Python attributes
                 attr_name = self._camel_to_snake(key)
-                setattr(resource, attr_name, value)
+                if keyword.iskeyword(attr_name):
+                    # e.g. EncounterHistory models "class" as class_
+                    attr_name += '_'
+                try:
+                    setattr(resource, attr_name, value)
+                except AttributeError:
+                    # Resource classes with __slots__ only accept the fields they model
+                    unmodeled[key] = value
+        
+        if unmodeled:
+            # to_dict() writes these back out, so they survive a round trip
+            resource._extra = unmodeled
+            warnings.warn(
+                f"{type(resource).__name__} does not model {', '.join(unmodeled)}; "
+                f"the values are kept in its _extra dict"
+            )
     
     def _camel_to_snake(self, name: str) -> str:
         """Convert camelCase to snake_case"""
@@ -4,6 +4,7 @@
 #include <Python.h>
 #include <stdbool.h>
 #include <cjson/cJSON.h>
+#include "fhir_modinit.h"
 
 // Forward declarations
 struct FHIRElement;
@@ -323,6 +323,6 @@ static struct PyModuleDef fhir_datatypes_module = {
 };
 
 // Module initialization
-PyMODINIT_FUNC PyInit_fhir_datatypes_c(void) {
+FHIR_MODINIT_FUNC PyInit_fhir_datatypes_c(void) {
     return PyModule_Create(&fhir_datatypes_module);
 }
\ No newline at end of file
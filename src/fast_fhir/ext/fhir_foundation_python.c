@@ -424,7 +424,7 @@ static struct PyModuleDef fhir_foundation_module = {
 };
 
 // Module initialization
-PyMODINIT_FUNC PyInit_fhir_foundation_c(void) {
+FHIR_MODINIT_FUNC PyInit_fhir_foundation_c(void) {
     return PyModule_Create(&fhir_foundation_module);
 }
 // Additional Python wrapper functions for new Foundation resources
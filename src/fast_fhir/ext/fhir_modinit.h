@@ -0,0 +1,14 @@
+#ifndef FHIR_MODINIT_H
+#define FHIR_MODINIT_H
+
+#include <Python.h>
+
+// Extensions are built with -fvisibility=hidden; the module init function must
+// stay exported. PyMODINIT_FUNC only carries default visibility from Python 3.9.
+#if defined(__GNUC__)
+#define FHIR_MODINIT_FUNC __attribute__((visibility("default"))) PyMODINIT_FUNC
+#else
+#define FHIR_MODINIT_FUNC PyMODINIT_FUNC
+#endif
+
+#endif // FHIR_MODINIT_H
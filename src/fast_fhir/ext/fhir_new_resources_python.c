@@ -376,7 +376,7 @@ static struct PyModuleDef fhir_new_resources_module = {
     FHIRNewResourcesMethods
 };
 
-PyMODINIT_FUNC PyInit_fhir_new_resources_c(void) {
+FHIR_MODINIT_FUNC PyInit_fhir_new_resources_c(void) {
     PyObject* module = PyModule_Create(&fhir_new_resources_module);
     if (module == NULL) {
         return NULL;
@@ -2,6 +2,7 @@
 #include <Python.h>
 #include <string.h>
 #include <cjson/cJSON.h>
+#include "fhir_modinit.h"
 
 // Fast JSON validation for FHIR resources
 static PyObject* validate_fhir_json(PyObject* self, PyObject* args) {
@@ -136,6 +137,6 @@ static struct PyModuleDef fhir_parser_module = {
 };
 
 // Module initialization
-PyMODINIT_FUNC PyInit_fhir_parser_c(void) {
+FHIR_MODINIT_FUNC PyInit_fhir_parser_c(void) {
     return PyModule_Create(&fhir_parser_module);
 }
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""Runtime code generation of resource methods from the declarative field tables.
+
+FHIRResourceBase.__init_subclass__ calls generate_methods() for every subclass
+that declares its own _FIELDS table. Each generated method is straight-line
+code with the attribute names and JSON keys inlined as literals, so there is
+no per-call loop over the table and no getattr() introspection. Methods a
+class defines itself are never replaced. The keys are not sys.intern()ed:
+dict lookups with an equal but distinct str cost the same, because str
+caches its hash.
+
+A class body derives its __slots__ from the same table with field_slots(), so
+_FIELDS is the single list of a resource's own attributes. A subclass that
+does not declare _FIELDS inherits its parent's generated methods unchanged;
+a direct FHIRResourceBase subclass without a table must implement the hooks
+itself, or instantiating it raises TypeError.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+# Field kinds, the third item of each (attribute, JSON key, kind) entry.
+VALUE = "value"  # serialized when truthy
+NOT_NONE = "not_none"  # serialized unless None: booleans and integers, where False/0 are values
+LIST = "list"  # a list, serialized when non-empty and parsed with a [] default
+
+_KINDS = (VALUE, NOT_NONE, LIST)
+
+
+def field_slots(fields: Tuple[Tuple[str, str, str], ...]) -> Tuple[str, ...]:
+    """__slots__ holding exactly the attributes of a _FIELDS table."""
+    return tuple(attr for attr, _, _ in fields)
+
+
+def _check_fields(cls) -> None:
+    attrs = set()
+    keys = set()
+    for attr, key, kind in cls._FIELDS:
+        if not attr.isidentifier():
+            raise TypeError(f"{cls.__name__}: field {attr!r} is not a valid attribute name")
+        if kind not in _KINDS:
+            raise TypeError(f"{cls.__name__}: field {attr!r} has unknown kind {kind!r}")
+        if attr in attrs or key in keys:
+            raise TypeError(f"{cls.__name__}: field {attr!r} ({key!r}) is listed twice")
+        attrs.add(attr)
+        keys.add(key)
+
+
+def _init_source(cls) -> List[str]:
+    """__init__ (only with _RESOURCE_TYPE) and _init_resource_fields() as unrolled stores."""
+    lines = []
+    if "_RESOURCE_TYPE" in cls.__dict__:
+        lines += [
+            "def __init__(self, id=None, use_c_extensions=True):",
+            f"    _base_init(self, {cls._RESOURCE_TYPE!r}, id, use_c_extensions)",
+        ]
+    lines.append("def _init_resource_fields(self):")
+    # LIST fields start as a fresh [] rather than a shared () sentinel: it
+    # costs ~15 ns per field, but callers may append to them directly.
+    for attr, _, kind in cls._FIELDS:
+        lines.append(f"    self.{attr} = {'[]' if kind == LIST else 'None'}")
+    if not cls._FIELDS:
+        lines.append("    pass")
+    return lines
+
+
+# The serialization hooks stay generated Python rather than C. A C loop over
+# the field table (PyObject_GetAttr, truth test, PyDict_SetItem per field)
+# measured ~20% slower than the generated Transport hook on CPython 3.11,
+# whose specialized slot loads beat a generic attribute lookup from C. A
+# getattr() comprehension over the table, merged in with dict | dict, was
+# ~3x slower than the generated hook.
+def _to_dict_source(cls) -> List[str]:
+    """_add_resource_specific_fields() emitting the fields in table order."""
+    lines = ["def _add_resource_specific_fields(self, result):"]
+    for attr, key, kind in cls._FIELDS:
+        test = f"self.{attr} is not None" if kind == NOT_NONE else f"self.{attr}"
+        lines += [f"    if {test}:", f"        result[{key!r}] = self.{attr}"]
+    if len(lines) == 1:
+        lines.append("    pass")
+    return lines
+
+
+def _from_dict_source(cls) -> List[str]:
+    """_parse_resource_specific_fields() setting every field from one data.get() each."""
+    lines = ["def _parse_resource_specific_fields(self, data):"]
+    for attr, key, kind in cls._FIELDS:
+        default = ", []" if kind == LIST else ""
+        lines.append(f"    self.{attr} = data.get({key!r}{default})")
+    return lines
+
+
+def generate_methods(cls, base_init: Callable[..., None]) -> None:
+    """Compile and attach the generated methods cls does not define itself.
+
+    base_init is FHIRResourceBase.__init__, which a generated __init__ calls
+    directly instead of looking it up through super().
+    """
+    own = cls.__dict__
+    if "_FIELDS" not in own:
+        return
+    _check_fields(cls)
+    lines = _init_source(cls) + _to_dict_source(cls) + _from_dict_source(cls)
+    docs = {
+        "_init_resource_fields": f"Initialize {cls.__name__}-specific fields.",
+        "_add_resource_specific_fields": f"Add {cls.__name__}-specific fields to the result dictionary.",
+        "_parse_resource_specific_fields": f"Parse {cls.__name__}-specific fields from data dictionary.",
+    }
+    if "_RESOURCE_TYPE" in own:
+        docs["__init__"] = f"Initialize {cls._RESOURCE_TYPE} resource."
+
+    namespace: Dict[str, Any] = {"_base_init": base_init}
+    exec(compile("\n".join(lines), f"<generated {cls.__name__} methods>", "exec"), namespace)
+    for name, doc in docs.items():
+        if name in own:
+            continue
+        func = namespace[name]
+        func.__qualname__ = f"{cls.__qualname__}.{name}"
+        func.__module__ = cls.__module__
+        func.__doc__ = doc
+        setattr(cls, name, func)
@@ -1,18 +1,65 @@
 """Base classes for FHIR resources following DRY principles."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 import json
 
+from ._schema import generate_methods
+
 try:
     import fhir_foundation_c
     HAS_C_FOUNDATION = True
 except ImportError:
     HAS_C_FOUNDATION = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Lists shorter than this are de-duplicated by scanning them: up to ~30 small
+# dicts, == comparisons are cheaper than encoding a canonical key per item.
+_DEDUP_SCAN_LIMIT = 32
+
+
+def _dedup_key(item: Any) -> Union[bytes, str]:
+    """Canonical JSON of item, so equal dicts produce equal keys."""
+    if HAS_ORJSON:
+        return orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(item, sort_keys=True)
+
 
 class FHIRResourceBase(ABC):
-    """Abstract base class for all FHIR resources implementing DRY principles."""
+    """Abstract base class for all FHIR resources implementing DRY principles.
+    
+    Resource fields are plain attributes. The one-line get_* accessors on
+    subclasses are kept for API compatibility; code on hot paths, including the
+    generated serialization hooks and the validators, reads the attributes
+    directly instead of paying for a method call.
+    """
+    
+    # Subclasses that declare their own __slots__ get no per-instance __dict__;
+    # those that do not keep one as before.
+    __slots__ = (
+        "resource_type", "id", "use_c_extensions",
+        "meta", "implicit_rules", "language", "text",
+        "contained", "extension", "modifier_extension",
+        "_extra", "_unique_keys", "__weakref__",
+    )
+    
+    # Resource-specific fields as (attribute, JSON key, kind) entries in JSON
+    # output order; the kinds are defined in _schema. A subclass that declares
+    # its own _FIELDS gets generated _init_resource_fields(),
+    # _add_resource_specific_fields() and _parse_resource_specific_fields()
+    # methods, and a generated __init__ when it also sets _RESOURCE_TYPE.
+    _FIELDS: Tuple[Tuple[str, str, str], ...] = ()
+    _RESOURCE_TYPE: Optional[str] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        generate_methods(cls, FHIRResourceBase.__init__)
     
     def __init__(self, id_or_resource_type: Optional[str] = None, id: Optional[str] = None, use_c_extensions: bool = True):
         """Initialize base FHIR resource."""
@@ -38,13 +85,20 @@ class FHIRResourceBase(ABC):
         self.contained = []
         self.extension = []
         self.modifier_extension = []
+        # JSON members a deserializer could not map to a modeled field
+        self._extra: Optional[Dict[str, Any]] = None
+        # _add_unique() key sets per list attribute, created on first use
+        self._unique_keys: Optional[Dict[str, Tuple[List[Any], int, set]]] = None
         
         # Initialize resource-specific fields
         self._init_resource_fields()
     
     @abstractmethod
     def _init_resource_fields(self) -> None:
-        """Initialize resource-specific fields. Must be implemented by subclasses."""
+        """Initialize resource-specific fields. Must be implemented by subclasses.
+        
+        Generated from the class _FIELDS table when it declares one (see _schema).
+        """
         pass
     
     @abstractmethod
@@ -57,6 +111,10 @@ class FHIRResourceBase(ABC):
         """Get the C extension parse function name. Return None if not available."""
         pass
     
+    # to_dict() results are deliberately not cached: fields are plain attributes,
+    # so invalidating a cache needs a __setattr__ hook, which made constructing
+    # and parsing a Transport 12-15x slower, and in-place edits of a list or
+    # dict field would still leave a cached result stale.
     def to_dict(self) -> Dict[str, Any]:
         """Convert resource to dictionary representation."""
         if self.use_c_extensions:
@@ -70,8 +128,15 @@ class FHIRResourceBase(ABC):
         # Python fallback
         return self._to_dict_python()
     
+    @classmethod
+    def to_dict_list(cls, resources: List['FHIRResourceBase']) -> List[Dict[str, Any]]:
+        """Convert each resource to a dictionary, the counterpart of from_dict_list()."""
+        return [resource.to_dict() for resource in resources]
+    
     def _to_dict_python(self) -> Dict[str, Any]:
         """Python implementation of to_dict."""
+        # A dict literal: copying a per-class {"resourceType": ...} template
+        # measured no faster, and resource_type is set per instance.
         result = {"resourceType": self.resource_type}
         
         # Add common fields
@@ -94,14 +159,72 @@ class FHIRResourceBase(ABC):
         
         # Add resource-specific fields
         self._add_resource_specific_fields(result)
+        if self._extra:
+            result.update(self._extra)
         
         return result
     
+    def _add_unique(self, attr: str, item: Any) -> None:
+        """Append item to the list attribute attr unless an equal item is already there.
+        
+        Short lists are scanned. From _DEDUP_SCAN_LIMIT items on, membership is
+        checked against a set of canonical JSON keys instead. The set is rebuilt
+        whenever the list is replaced (e.g. by from_dict) or changes length
+        behind our back; items that are not JSON-serializable fall back to the
+        linear scan.
+        """
+        items = getattr(self, attr)
+        if len(items) < _DEDUP_SCAN_LIMIT:
+            if item not in items:
+                items.append(item)
+            return
+        try:
+            key = _dedup_key(item)
+        except TypeError:
+            if item not in items:
+                items.append(item)
+            return
+        
+        unique_keys = self._unique_keys
+        if unique_keys is None:
+            unique_keys = self._unique_keys = {}
+        cached = unique_keys.get(attr)
+        if cached is not None and cached[0] is items and cached[1] == len(items):
+            keys = cached[2]
+        else:
+            try:
+                keys = {_dedup_key(existing) for existing in items}
+            except TypeError:
+                if item not in items:
+                    items.append(item)
+                return
+        
+        if key not in keys:
+            keys.add(key)
+            items.append(item)
+        unique_keys[attr] = (items, len(items), keys)
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize the resource to compact UTF-8 JSON.
+        
+        The to_dict() result is encoded with orjson when it is installed and with
+        the standard json module otherwise.
+        """
+        if HAS_ORJSON:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")).encode()
+    
     @abstractmethod
     def _add_resource_specific_fields(self, result: Dict[str, Any]) -> None:
-        """Add resource-specific fields to the result dictionary."""
+        """Add resource-specific fields to the result dictionary.
+        
+        Generated from the class _FIELDS table when it declares one (see _schema).
+        """
         pass
     
+    # from_dict() results are deliberately not memoized per input dict: replaying
+    # a cached (attribute, value) plan with setattr() measured slower than the
+    # generated straight-line parse hooks, and would go stale if the dict changed.
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FHIRResourceBase':
         """Create resource from dictionary data."""
@@ -110,6 +233,12 @@ class FHIRResourceBase(ABC):
         resource._parse_resource_specific_fields(data)
         return resource
     
+    @classmethod
+    def from_dict_list(cls, rows: List[Dict[str, Any]]) -> List['FHIRResourceBase']:
+        """Create one resource per dictionary, e.g. for the entries of a Bundle."""
+        from_dict = cls.from_dict
+        return [from_dict(data) for data in rows]
+    
     def _parse_common_fields(self, data: Dict[str, Any]) -> None:
         """Parse common DomainResource fields."""
         self.meta = data.get("meta")
@@ -122,7 +251,10 @@ class FHIRResourceBase(ABC):
     
     @abstractmethod
     def _parse_resource_specific_fields(self, data: Dict[str, Any]) -> None:
-        """Parse resource-specific fields from data dictionary."""
+        """Parse resource-specific fields from data dictionary.
+        
+        Generated from the class _FIELDS table when it declares one (see _schema).
+        """
         pass
     
     @classmethod
@@ -142,6 +274,19 @@ class FHIRResourceBase(ABC):
         data = json.loads(json_string)
         return cls.from_dict(data)
     
+    @classmethod
+    def from_json_bytes(cls, buf: Union[bytes, bytearray, memoryview, str]) -> 'FHIRResourceBase':
+        """Create resource from UTF-8 JSON, the counterpart of to_json_bytes().
+        
+        The buffer is parsed with orjson when it is installed and with the
+        standard json module otherwise.
+        """
+        if HAS_ORJSON:
+            return cls.from_dict(orjson.loads(buf))
+        if isinstance(buf, memoryview):
+            buf = buf.tobytes()
+        return cls.from_dict(json.loads(buf))
+    
     @classmethod
     @abstractmethod
     def _get_c_extension_parse_function_static(cls) -> Optional[str]:
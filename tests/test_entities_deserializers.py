@@ -22,6 +22,7 @@ from fast_fhir.deserializers import (
     deserialize_organization_affiliation,
     PYDANTIC_ENTITIES_AVAILABLE
 )
+from fast_fhir.resources.encounter_history import EncounterHistory
 
 
 class TestEntitiesDeserializers(unittest.TestCase):
@@ -248,6 +249,33 @@ class TestEntitiesDeserializers(unittest.TestCase):
             self.assertEqual(resource.resource_type, resource_data["resourceType"])
             self.assertEqual(resource.id, resource_data["id"])
     
+    def test_unmodeled_fields_survive_round_trip(self):
+        """Test fields a slotted resource does not model are kept and serialized again"""
+        device_metric_data = {
+            "resourceType": "DeviceMetric",
+            "id": "test-metric",
+            "identifier": [{"system": "http://example.org/metrics", "value": "hr-1"}],
+            "color": "red"
+        }
+        
+        with self.assertWarnsRegex(UserWarning, "DeviceMetric does not model identifier"):
+            device_metric = self.deserializer.deserialize_entities_resource(device_metric_data)
+        self.assertEqual(device_metric.color, "red")
+        self.assertEqual(device_metric._extra, {"identifier": device_metric_data["identifier"]})
+        
+        data = device_metric.to_dict()
+        self.assertEqual(data["identifier"], device_metric_data["identifier"])
+        self.assertEqual(data["color"], "red")
+    
+    def test_keyword_fields_use_trailing_underscore(self):
+        """Test a JSON member named after a Python keyword sets the attribute_ field"""
+        history = EncounterHistory("test-history")
+        self.deserializer._set_resource_attributes(history, {"class": {"code": "IMP"}})
+        
+        self.assertEqual(history.class_, {"code": "IMP"})
+        self.assertIsNone(history._extra)
+        self.assertEqual(history.to_dict()["class"], {"code": "IMP"})
+    
     def test_datetime_conversion(self):
         """Test datetime field conversion"""
         device_with_dates = self.device_data.copy()
@@ -2,7 +2,7 @@
 
 import pytest
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 
 from fast_fhir.resources.organization_affiliation import OrganizationAffiliation
@@ -14,6 +14,8 @@ from fast_fhir.resources.appointment_response import AppointmentResponse
 from fast_fhir.resources.verification_result import VerificationResult
 from fast_fhir.resources.encounter_history import EncounterHistory
 from fast_fhir.resources.episode_of_care import EpisodeOfCare
+from fast_fhir.resources.base import FHIRResourceBase
+from fast_fhir.resources._schema import LIST, VALUE
 
 
 class TestOrganizationAffiliation:
@@ -176,6 +178,20 @@ class TestDeviceMetric:
         
         with pytest.raises(ValueError):
             metric.set_category("invalid")
+    
+    def test_set_code_rejects_non_string_values(self):
+        """Test set_* mutators raise ValueError for None and non-string codes."""
+        metric = DeviceMetric("test-device-metric-1")
+        with pytest.raises(ValueError, match="Invalid operational status: None"):
+            metric.set_operational_status(None)
+        with pytest.raises(ValueError, match="Invalid color: 1"):
+            metric.set_color(1)
+        with pytest.raises(ValueError, match="Invalid participant status: None"):
+            AppointmentResponse("appt-resp-1").set_participant_status(None)
+        with pytest.raises(ValueError, match="Invalid status: 5"):
+            EncounterHistory("encounter-hist-1").set_status(5)
+        assert metric.operational_status is None
+        assert not metric.validate()
 
 
 class TestNutritionProduct:
@@ -266,6 +282,27 @@ class TestTransport:
         
         transport.set_priority("urgent")
         assert transport.is_high_priority() is True
+    
+    def test_transport_to_dict(self):
+        """Test Transport serializes its fields under their FHIR names."""
+        transport = Transport("test-transport-1")
+        transport.set_status("in-progress")
+        transport.intent = "order"
+        transport.for_reference = {"reference": "Patient/123"}
+        transport.add_input({"type": {"text": "specimen"}})
+        
+        assert transport.to_dict() == {
+            "resourceType": "Transport",
+            "id": "test-transport-1",
+            "status": "in-progress",
+            "intent": "order",
+            "for": {"reference": "Patient/123"},
+            "input": [{"type": {"text": "specimen"}}],
+        }
+        
+        restored = Transport.from_dict(transport.to_dict())
+        assert restored.for_reference == {"reference": "Patient/123"}
+        assert restored.to_dict() == transport.to_dict()
 
 
 class TestAppointmentResponse:
@@ -305,6 +342,50 @@ class TestAppointmentResponse:
         
         response.set_participant_status("tentative")
         assert response.is_tentative() is True
+    
+    def test_appointment_response_participant_type_dedup(self):
+        """Test add_participant_type ignores equal participant types."""
+        response = AppointmentResponse("test-appointment-response-1")
+        assert response._unique_keys is None
+        response.add_participant_type({"text": "Attender", "coding": []})
+        response.add_participant_type({"coding": [], "text": "Attender"})
+        response.add_participant_type({"text": "Translator"})
+        assert len(response.participant_type) == 2
+        
+        restored = AppointmentResponse.from_dict(response.to_dict())
+        restored.add_participant_type({"text": "Translator"})
+        restored.add_participant_type({"text": "Witness"})
+        assert [t["text"] for t in restored.participant_type] == ["Attender", "Translator", "Witness"]
+        
+        # Long lists switch from scanning to the canonical key set
+        for i in range(40):
+            restored.add_participant_type({"text": f"Role {i}", "coding": []})
+        restored.add_participant_type({"coding": [], "text": "Role 3"})
+        restored.add_participant_type({"text": "Attender", "coding": []})
+        assert restored._unique_keys is not None
+        assert len(restored.participant_type) == 43
+    
+    def test_appointment_response_to_dict(self):
+        """Test AppointmentResponse serialization keeps False/0 values and key order."""
+        response = AppointmentResponse("test-appointment-response-1")
+        response.set_appointment({"reference": "Appointment/123"})
+        response.set_participant_status("accepted")
+        response.add_participant_type({"text": "attender"})
+        response.set_recurring(False)
+        response.set_occurrence_date("2024-01-01")
+        response.set_occurrence_count(0)
+        
+        data = response.to_dict()
+        assert list(data) == [
+            "resourceType", "id", "appointment", "participantType", "participantStatus",
+            "recurring", "occurrenceDate", "occurrenceCount",
+        ]
+        assert data["appointment"] == {"reference": "Appointment/123"}
+        assert data["participantStatus"] == "accepted"
+        assert data["participantType"] == [{"text": "attender"}]
+        assert data["recurring"] is False
+        assert data["occurrenceCount"] == 0
+        assert "comment" not in data
 
 
 class TestVerificationResult:
@@ -390,6 +471,22 @@ class TestEncounterHistory:
         
         history.set_status("in-progress")
         assert history.is_in_progress() is True
+    
+    def test_encounter_history_round_trip(self):
+        """Test EncounterHistory fields survive to_dict/from_dict."""
+        history = EncounterHistory("test-encounter-history-1")
+        history.set_status("completed")
+        history.set_encounter_class({"code": "IMP"})
+        history.set_subject({"reference": "Patient/123"})
+        history.set_encounter_reference({"reference": "Encounter/456"})
+        history.add_location({"location": {"reference": "Location/1"}})
+        
+        restored = EncounterHistory.from_dict(history.to_dict())
+        assert restored.status == "completed"
+        assert restored.class_ == {"code": "IMP"}
+        assert restored.location == [{"location": {"reference": "Location/1"}}]
+        assert restored.service_type == []
+        assert restored.validate()
 
 
 class TestEpisodeOfCare:
@@ -432,6 +529,21 @@ class TestEpisodeOfCare:
         assert episode.is_finished() is True
         assert episode.is_active() is False
     
+    def test_episode_of_care_status_history(self):
+        """Test status changes record the previous status with a UTC end time."""
+        episode = EpisodeOfCare("test-episode-of-care-1")
+        episode.set_status("planned")
+        episode.set_status("planned")
+        assert episode.get_status_history() == []
+        
+        before = datetime.now(timezone.utc).replace(microsecond=0)
+        episode.set_status("active")
+        entry, = episode.get_status_history()
+        assert entry["status"] == "planned"
+        end = datetime.fromisoformat(entry["period"]["end"])
+        assert end.utcoffset() == timedelta(0)
+        assert before <= end <= datetime.now(timezone.utc)
+    
     def test_episode_of_care_diagnosis_methods(self):
         """Test EpisodeOfCare diagnosis methods."""
         episode = EpisodeOfCare("test-episode-of-care-1")
@@ -460,6 +572,43 @@ class TestEpisodeOfCare:
         
         primary_diagnoses = episode.get_diagnoses_by_role("primary")
         assert len(primary_diagnoses) == 1
+        
+        # Diagnoses without a role (or with role: null) are skipped
+        episode.add_diagnosis({"condition": {"reference": "Condition/789"}})
+        episode.add_diagnosis({"condition": {"reference": "Condition/790"}, "role": None})
+        assert episode.get_diagnoses_by_role("primary") == [primary_diagnosis]
+    
+    def test_episode_of_care_dedup(self):
+        """Test add_type/add_referral_request/add_care_team/add_account ignore equal items."""
+        episode = EpisodeOfCare("test-episode-of-care-1")
+        episode.add_type({"text": "Home care", "coding": []})
+        episode.add_type({"coding": [], "text": "Home care"})
+        episode.add_referral_request({"reference": "ServiceRequest/1"})
+        episode.add_referral_request({"reference": "ServiceRequest/1"})
+        episode.add_care_team({"reference": "CareTeam/1"})
+        episode.add_care_team({"reference": "CareTeam/2"})
+        episode.add_account({"reference": "Account/1"})
+        episode.add_account({"reference": "Account/1"})
+        assert len(episode.type) == 1
+        assert len(episode.referral_request) == 1
+        assert len(episode.team) == 2
+        assert len(episode.account) == 1
+    
+    def test_episode_of_care_round_trip(self):
+        """Test EpisodeOfCare fields survive to_dict/from_dict."""
+        episode = EpisodeOfCare("test-episode-of-care-1")
+        episode.set_status("active")
+        episode.set_patient({"reference": "Patient/123"})
+        episode.add_type({"text": "Home care"})
+        episode.set_managing_organization({"reference": "Organization/1"})
+        
+        restored = EpisodeOfCare.from_dict(episode.to_dict())
+        assert restored.to_dict() == episode.to_dict()
+        assert restored.validate()
+        assert restored.get_diagnoses() == []
+        
+        restored.add_diagnosis({"condition": {"reference": "Condition/123"}, "rank": 1})
+        assert restored.get_primary_diagnosis()["rank"] == 1
 
 
 class TestResourceIntegration:
@@ -495,6 +644,112 @@ class TestResourceIntegration:
             assert new_resource.id == resource.id
             assert new_resource.resource_type == resource.resource_type
     
+    def test_slotted_resources_have_no_instance_dict(self):
+        """Test that resources declaring __slots__ do not allocate a __dict__."""
+        for resource in (DeviceMetric("device-metric-1"),
+                         AppointmentResponse("appt-resp-1"),
+                         EncounterHistory("encounter-hist-1")):
+            assert not hasattr(resource, "__dict__")
+            with pytest.raises(AttributeError):
+                resource.not_a_field = True
+    
+    def test_generated_initializers(self):
+        """Test generated __init__ sets every field with fresh list defaults."""
+        first = DeviceMetric("device-metric-1", use_c_extensions=False)
+        second = DeviceMetric("device-metric-2")
+        assert first.id == "device-metric-1"
+        assert first.resource_type == "DeviceMetric"
+        assert first.type is None and first.operational_status is None
+        first.add_calibration({"type": "gain"})
+        assert second.calibration == []
+        assert DeviceMetric.__init__.__qualname__ == "DeviceMetric.__init__"
+    
+    def test_field_table_drives_init_slots_and_serialization(self):
+        """Test __init__, __slots__, to_dict and from_dict all follow _FIELDS."""
+        for cls in (AppointmentResponse, DeviceMetric, EncounterHistory, Transport, EpisodeOfCare):
+            assert cls.__slots__ == tuple(attr for attr, _, _ in cls._FIELDS)
+            resource = cls("resource-1")
+            populated = {}
+            for attr, key, kind in cls._FIELDS:
+                assert getattr(resource, attr) == ([] if kind == LIST else None)
+                populated[key] = [{"text": attr}] if kind == LIST else f"{attr}-value"
+            restored = cls.from_dict(populated)
+            assert {key: restored.to_dict()[key] for key in populated} == populated
+    
+    def test_generated_methods_need_an_own_field_table(self):
+        """Test codegen only runs for classes that declare _FIELDS themselves."""
+        class BareResource(FHIRResourceBase):
+            pass
+        
+        with pytest.raises(TypeError):
+            BareResource("bare-1")
+        
+        class TaggedHistory(EncounterHistory):
+            __slots__ = ()
+            
+            def _add_resource_specific_fields(self, result):
+                result["tagged"] = True
+        
+        assert TaggedHistory._parse_resource_specific_fields is EncounterHistory._parse_resource_specific_fields
+        history = TaggedHistory.from_dict({"id": "encounter-hist-1", "status": "planned"})
+        assert history.status == "planned"
+        assert history.to_dict() == {"resourceType": "EncounterHistory", "id": "encounter-hist-1", "tagged": True}
+        
+        with pytest.raises(TypeError, match="listed twice"):
+            class DuplicateField(EncounterHistory):
+                _FIELDS = EncounterHistory._FIELDS + (("status", "status", VALUE),)
+    
+    def test_from_dict_list(self):
+        """Test from_dict_list matches from_dict row by row."""
+        rows = [
+            {"resourceType": "EncounterHistory", "id": f"encounter-hist-{i}", "status": "completed",
+             "location": [{"location": {"reference": f"Location/{i}"}}]}
+            for i in range(3)
+        ]
+        histories = EncounterHistory.from_dict_list(rows)
+        assert [h.to_dict() for h in histories] == [EncounterHistory.from_dict(r).to_dict() for r in rows]
+        assert EncounterHistory.from_dict_list([]) == []
+    
+    def test_to_dict_list(self):
+        """Test to_dict_list matches to_dict resource by resource."""
+        transports = []
+        for i in range(3):
+            transport = Transport(f"transport-{i}")
+            transport.set_status("in-progress")
+            transport.for_reference = {"reference": f"Patient/{i}"}
+            transports.append(transport)
+        transports.append(EpisodeOfCare("episode-1"))
+        assert Transport.to_dict_list(transports) == [t.to_dict() for t in transports]
+        assert Transport.to_dict_list([]) == []
+    
+    def test_to_json_bytes_matches_to_dict(self):
+        """Test that to_json_bytes() encodes the same content as to_dict()."""
+        response = AppointmentResponse("appt-resp-1")
+        response.set_participant_status("accepted")
+        response.add_participant_type({"text": "Attender"})
+        response.comment = "Gr\u00fc\u00dfe"
+        response.recurring = False
+        metric = DeviceMetric("device-metric-1")
+        metric.set_operational_status("on")
+        history = EncounterHistory("encounter-hist-1")
+        history.set_status("completed")
+        history.set_encounter_class({"code": "IMP"})
+        transport = Transport("transport-1")
+        transport.set_status("in-progress")
+        transport.intent = "order"
+        transport.for_reference = {"reference": "Patient/123"}
+        transport.add_note({"text": "fragile"})
+        episode = EpisodeOfCare("episode-1")
+        episode.set_status("active")
+        episode.set_patient({"reference": "Patient/123"})
+        for resource in (response, metric, history, transport, episode):
+            data = resource.to_json_bytes()
+            assert isinstance(data, bytes)
+            assert json.loads(data) == resource.to_dict()
+            assert list(json.loads(data)) == list(resource.to_dict())
+            assert type(resource).from_json_bytes(data).to_dict() == resource.to_dict()
+            assert type(resource).from_json_bytes(memoryview(data)).to_dict() == resource.to_dict()
+    
     def test_resource_validation_consistency(self):
         """Test that all resources have consistent validation behavior."""
         resources = [